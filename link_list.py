@@ -0,0 +1,470 @@
+"""
+Shared implementation behind link-list.py, link-list-v2.py and link-list-new.py.
+
+Generates a CSV of image files from local folders with GitHub URLs.
+Output columns: nama_proyek, periode, nama_di, nama_gambar, url
+
+Usage:
+  python link_list.py [path/to/folder]
+  If no path provided, scans all Oplah folders in current directory
+"""
+
+import configparser
+import concurrent.futures
+import csv
+import functools
+import itertools
+import os
+import queue
+import re
+import subprocess
+import sys
+import threading
+from typing import Callable, Iterable, Iterator, List, Sequence, TextIO, Tuple
+
+
+ALLOWED_EXT = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp", ".tif", ".tiff", ".svg"})
+# Tuple form for str.endswith; only the last EXT_TAIL chars need lowercasing
+ALLOWED_EXT_TUPLE = tuple(sorted(ALLOWED_EXT))
+EXT_TAIL = max(len(ext) for ext in ALLOWED_EXT)
+
+# Where supported (POSIX), open each directory relative to its parent's fd
+# like os.fwalk does, so the kernel never re-resolves the full path
+WALK_BY_FD = os.scandir in os.supports_fd and os.open in os.supports_dir_fd
+DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+# walk_ahead hands paths from its worker over in chunks of WALK_AHEAD_CHUNK,
+# with at most WALK_AHEAD_CHUNKS chunks waiting in the queue
+WALK_AHEAD_CHUNK = 1024
+WALK_AHEAD_CHUNKS = 8
+
+# project/period/<anything>D.I name/... -> (project, period, "D.I name")
+DI_PATH_RE = re.compile(r"([^/]*)/([^/]*)/[^/]*?(D\.I[^/]*)")
+
+# project/period/di_folder/... -> (project, period, di_folder)
+DI_FOLDER_RE = re.compile(r"([^/]*)/([^/]*)/([^/]*)/")
+
+# Fields with a quote or line break must go through csv.writer
+NEEDS_QUOTING_RE = re.compile(r'["\r\n]')
+
+# URL prefix per url_style; the file path is appended after encode_path
+URL_PREFIXES = {
+    "raw": "https://raw.githubusercontent.com/{owner}/{repo}/refs/heads/{branch}/",
+    "blob": "https://github.com/{owner}/{repo}/blob/{branch}/",
+}
+
+HEADER = ["nama_proyek", "periode", "nama_di", "nama_gambar", "url"]
+# Column names written by the original link-list.py
+LEGACY_HEADER = ["folder", "subfolder", "subfolder", "nama gambar", "url"]
+
+
+def is_image(filename: str) -> bool:
+    # Lowercasing just the tail is cheaper than slicing at rfind(".") first
+    if not filename[-EXT_TAIL:].lower().endswith(ALLOWED_EXT_TUPLE):
+        return False
+    # As with os.path.splitext, leading dots are not an extension (".png")
+    return bool(filename[:filename.rfind(".")].lstrip("."))
+
+
+def _git(*args: str) -> subprocess.Popen:
+    """Start a git command with its output captured as text."""
+    return subprocess.Popen(
+        ["git", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+
+
+def _git_output(proc: subprocess.Popen) -> str:
+    """Wait for a git command started by _git and return its stripped output."""
+    out, err = proc.communicate()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, out, err)
+    return out.strip()
+
+
+def _read_git_dir() -> Tuple[str, str] | None:
+    """Read origin URL and branch straight from ./.git, or None if that fails."""
+    # Worktrees and submodules have a .git file instead; leave those to git
+    if not os.path.isdir(".git"):
+        return None
+    try:
+        with open(os.path.join(".git", "HEAD"), encoding="utf-8") as f:
+            head = f.read().strip()
+        config = configparser.ConfigParser(strict=False, interpolation=None)
+        config.read(os.path.join(".git", "config"), encoding="utf-8")
+        remote = config.get('remote "origin"', "url")
+    except (OSError, configparser.Error):
+        return None
+    # configparser keeps git's inline comments, quotes and escapes as part of
+    # the value, so leave any URL that might contain them for git to decode
+    if not remote or any(c in remote for c in ' \t"\\;#'):
+        return None
+
+    # Same as "git rev-parse --abbrev-ref HEAD", which prints HEAD when detached
+    if head.startswith("ref: refs/heads/"):
+        return remote, head[len("ref: refs/heads/"):]
+    return remote, "HEAD"
+
+
+def _ask_git() -> Tuple[str, str]:
+    """Get origin URL and branch by running git."""
+    # Start both git queries up front so their startup costs overlap
+    with _git("config", "--get", "remote.origin.url") as remote_proc, \
+            _git("rev-parse", "--abbrev-ref", "HEAD") as branch_proc:
+        return _git_output(remote_proc), _git_output(branch_proc)
+
+
+@functools.lru_cache(maxsize=1)
+def get_git_info() -> Tuple[str, str, str]:
+    """Get GitHub repository info from local git repo."""
+    try:
+        # Reading .git directly avoids spawning git at all in the common case
+        remote, branch = _read_git_dir() or _ask_git()
+    except subprocess.CalledProcessError:
+        raise ValueError("Not in a git repository or git not installed")
+
+    # Extract owner/repo from remote URL
+    if "github.com" not in remote:
+        raise ValueError("Not a GitHub repository")
+
+    if remote.startswith("https"):
+        # https URL format
+        _, _, _, owner, repo = remote.rstrip(".git").split("/")
+    else:
+        # SSH format
+        _, owner_repo = remote.split(":")
+        owner, repo = owner_repo.rstrip(".git").split("/")
+
+    return owner, repo, branch
+
+
+def encode_path(path: str) -> str:
+    """Encode spaces in path with %20."""
+    # "/" is never a space, so the whole path can be encoded in one pass
+    return path.replace(' ', '%20')
+
+
+def make_github_url(owner: str, repo: str, branch: str, path: str, url_style: str = "raw") -> str:
+    """Generate a GitHub URL for a file with properly encoded spaces.
+
+    url_style "raw" gives a raw.githubusercontent.com URL, "blob" a github.com page.
+    """
+    prefix = URL_PREFIXES[url_style].format(owner=owner, repo=repo, branch=branch)
+    return prefix + encode_path(path)
+
+
+def fast_row(fields: list[str]) -> str | None:
+    """Format fields as one CSV line, or return None if a field needs quoting."""
+    line = ",".join(fields)
+    # A comma inside a field shows up as an extra separator
+    if line.count(",") != len(fields) - 1 or NEEDS_QUOTING_RE.search(line):
+        return None
+    return line + "\r\n"  # csv.writer's default line terminator
+
+
+def write_paths(
+    fh: TextIO,
+    header: Sequence[str],
+    paths: Iterable[str],
+    path_parser: Callable[[str], Sequence[str]],
+    url_prefix: str = "",
+) -> int:
+    """Write header, then one row per path to fh as the paths are walked.
+
+    Returns the number of path rows. Rows that need quoting go through
+    csv.writer. Without url_prefix the url is empty.
+    """
+    write = fh.write
+    writerow = csv.writer(fh).writerow
+    rows = (
+        [*path_parser(path), url_prefix + encode_path(path) if url_prefix else ""]
+        for path in paths
+    )
+    # The header takes the same fast path but is not counted as a row
+    count = -1
+    for row in itertools.chain([list(header)], rows):
+        line = fast_row(row)
+        if line is None:
+            writerow(row)
+        else:
+            write(line)
+        count += 1
+    return count
+
+
+def row_from_path(path: str) -> List[str]:
+    """Extract project name, period (M3, etc), DI name, and filename from path."""
+    # Fast path: one regex scan when the third folder holds a D.I name
+    match = DI_PATH_RE.match(path)
+    if match:
+        project_name, period, di_name = match.groups()
+        return [project_name, period, di_name.strip(), "./" + path]
+
+    parts = path.split('/')
+    if not parts:
+        return ["", "", "", ""]
+
+    # Get the project name (first folder)
+    project_name = parts[0] if len(parts) > 0 else ""
+    
+    # Get the period (M3, M4, etc) - should be second part
+    period = parts[1] if len(parts) > 1 else ""
+    
+    # Get DI name - should be in the folder name after M3/M4/etc
+    # Often in format like "1. M3 D.I Citasuk Banten Paket I"
+    di_name = ""
+    if len(parts) > 2:
+        folder_name = parts[2]
+        # Extract D.I name if present
+        if "D.I" in folder_name:
+            di_start = folder_name.find("D.I")
+            di_name = folder_name[di_start:].split("/")[0].strip()
+    
+    # Full relative path as image name
+    image_path = "./"+path
+    
+    return [project_name, period, di_name, image_path]
+
+
+def clean_folder_name(name: str) -> str:
+    """Clean up folder names by removing numbering prefixes."""
+    # Remove numbering like "1. " or "1. M3" from DI folder names
+    if '. ' in name and name[0].isdigit():
+        name = name.split('. ', 1)[1]
+    return name
+
+
+def parse_path_info(path: str) -> Tuple[str, str, str, str]:
+    """Parse path into nama_proyek, periode, nama_di, and nama_gambar."""
+    # Fast path: files inside a DI folder are parsed with one regex scan
+    match = DI_FOLDER_RE.match(path, 2 if path.startswith("./") else 0)
+    if match:
+        nama_proyek, periode, di_folder = match.groups()
+        return nama_proyek, periode, clean_folder_name(di_folder), path
+
+    parts = path.split('/')
+    
+    # Remove ./ prefix if present
+    if parts[0] == '.':
+        parts = parts[1:]
+    
+    # Handle files directly in project folder
+    if len(parts) == 2:
+        nama_proyek, nama_gambar = parts
+        return nama_proyek, "", "", path
+        
+    # Handle files in period folders (e.g., M3, M4)
+    if len(parts) == 3:
+        nama_proyek, periode, nama_gambar = parts
+        return nama_proyek, periode, "", path
+        
+    # Handle files in DI folders
+    nama_proyek = parts[0]  # First part is always project name
+    periode = parts[1]      # Second part is period (M3, M4, etc)
+    
+    # For DI name, we want the part after the period numbering
+    # Example: "1. M3 D.I Citasuk Banten Paket I" -> "D.I Citasuk Banten Paket I"
+    di_folder = parts[2]
+    nama_di = clean_folder_name(di_folder)
+    
+    return nama_proyek, periode, nama_di, path
+
+
+def _scan(rel_prefix: str, path: str, dir_fd: int | None = None) -> Iterator[str]:
+    """Yield image paths under path, prefixed with rel_prefix, in sorted order.
+
+    With dir_fd, path is a directory name relative to that descriptor.
+    """
+    fd = None
+    try:
+        if WALK_BY_FD:
+            fd = os.open(path, DIR_OPEN_FLAGS, dir_fd=dir_fd)
+            it = os.scandir(fd)
+        else:
+            it = os.scandir(path)
+        with it:
+            # Directories sort as "name/" so the walk order matches a plain
+            # string sort of the full paths
+            entries = sorted(
+                it,
+                key=lambda e: e.name + "/" if e.is_dir(follow_symlinks=False) else e.name
+            )
+    except OSError:
+        # Unreadable directories are skipped, like os.walk does
+        if fd is not None:
+            os.close(fd)
+        return
+    try:
+        for entry in entries:
+            # DirEntry caches the file type, so no extra stat per entry
+            if entry.is_dir(follow_symlinks=False):
+                if fd is None:
+                    yield from _scan(rel_prefix + entry.name + "/", entry.path)
+                else:
+                    yield from _scan(rel_prefix + entry.name + "/", entry.name, fd)
+            # Like os.walk, anything but a directory is listed as a file,
+            # including broken symlinks, FIFOs and sockets
+            elif is_image(entry.name) and not entry.is_dir():
+                yield rel_prefix + entry.name
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+
+def list_images(root_path: str, prefix: str = "") -> Iterator[str]:
+    """Yield all image file paths under root_path recursively, in sorted order.
+
+    Paths are relative to root_path, with prefix prepended to each one.
+    """
+    # Relative paths are built with "/" directly, so they are URL-ready;
+    # each directory's prefix is built once and each file costs one concat
+    yield from _scan(prefix, root_path)
+
+
+def walk_ahead(folders: list[str], walk: Callable[[str], Iterable[str]]) -> Iterator[str]:
+    """Yield walk(folder) for each folder in turn, walked on a worker thread.
+
+    The worker hands paths over in chunks through a bounded queue, so the walk
+    overlaps with writing while memory stays at a few chunks, whatever the
+    folder sizes.
+    """
+    chunks: queue.Queue = queue.Queue(maxsize=WALK_AHEAD_CHUNKS)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for folder in folders:
+                paths = iter(walk(folder))
+                while not stop.is_set():
+                    chunk = list(itertools.islice(paths, WALK_AHEAD_CHUNK))
+                    if not chunk:
+                        break
+                    chunks.put(chunk)
+        finally:
+            chunks.put(None)  # end of stream, also after an error
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as ex:
+        future = ex.submit(produce)
+        try:
+            for chunk in iter(chunks.get, None):
+                yield from chunk
+            # Re-raise anything the walk raised
+            future.result()
+        finally:
+            # If the consumer stopped early, keep freeing queue space until a
+            # blocked put returns and the worker sees stop
+            stop.set()
+            while not future.done():
+                try:
+                    chunks.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+
+
+def scan_current_directory() -> list[str]:
+    """Scan current directory for folders and return them."""
+    # DirEntry.is_dir uses the cached file type instead of a stat per item
+    with os.scandir(".") as it:
+        return sorted(
+            entry.name for entry in it
+            if entry.name.startswith("Oplah") and entry.is_dir()
+        )
+
+
+def generate(
+    folder: str | None = None,
+    url_style: str = "raw",
+    path_parser: Callable[[str], Sequence[str]] = parse_path_info,
+    path_prefix: str = "./",
+    header: Sequence[str] = HEADER,
+    out_file: str = "images.csv",
+) -> int:
+    """Write out_file listing every image under folder, or under all Oplah folders.
+
+    path_parser turns each path into the first four columns; path_prefix is
+    prepended to "{folder}/{relative path}" before it is parsed and linked.
+    Returns the process exit code.
+    """
+    if url_style not in URL_PREFIXES:
+        raise ValueError(f"Unknown url_style: {url_style}")
+
+    # If no folder provided, scan current directory
+    if folder is None:
+        folders = scan_current_directory()
+        if not folders:
+            print("Error: No Oplah folders found in current directory")
+            return 1
+
+        print(f"Found {len(folders)} folders to scan:")
+        for f in folders:
+            print(f"- {f}")
+
+        existing = []
+        for name in folders:
+            if not os.path.isdir(name):
+                print(f"Warning: Folder not found: {name}")
+                continue
+            existing.append(name)
+
+        # Stream paths folder by folder (each walk is already sorted); the
+        # walk runs ahead on a worker thread, a bounded number of paths ahead
+        files = walk_ahead(
+            existing, lambda name: list_images(name, f"{path_prefix}{name}/")
+        )
+    else:
+        if not os.path.isdir(folder):
+            print(f"Error: Folder not found: {folder}", file=sys.stderr)
+            return 2
+        # The walk builds "/"-separated paths itself (no os.path.join/relpath
+        # per file), so only the user-supplied folder needs normalising, once
+        url_folder = folder.replace(os.sep, "/").rstrip("/")
+        files = list_images(folder, f"{path_prefix}{url_folder}/")
+
+    try:
+        # Get GitHub info for URLs
+        try:
+            owner, repo, branch = get_git_info()
+            print(f"Found GitHub repo: {owner}/{repo} @ {branch}")
+        except ValueError as e:
+            print(f"Warning: {e}")
+            print("URLs will not be generated")
+            owner = repo = branch = None
+
+        # Peek at the first path so an empty tree still skips out_file
+        first = next(files, None)
+        if first is None:
+            print("No image files found.")
+            return 0
+
+        url_prefix = ""
+        if owner and repo and branch:
+            # Same URL as make_github_url, with the prefix formatted once
+            url_prefix = URL_PREFIXES[url_style].format(owner=owner, repo=repo, branch=branch)
+
+        with open(out_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as fh:
+            # Walk, parse and write in one pass. Besides the file buffer, only
+            # walk_ahead's bounded queue and the sorted listing of each open
+            # directory are held, so memory does not grow with the file count
+            count = write_paths(
+                fh, header, itertools.chain([first], files), path_parser, url_prefix
+            )
+
+        print(f"Wrote {count} rows to {out_file}")
+        return 0
+
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 3
+
+
+def main(argv: list[str] | None = None, **options) -> int:
+    """Run generate() for the folder given in argv, if any; options go to generate()."""
+    if not argv:
+        argv = sys.argv[1:]
+    return generate(argv[0] if argv else None, **options)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())